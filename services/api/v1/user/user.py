@@ -232,6 +232,18 @@ class UserResponse(UserBase):
     def serialize_dt(self: "UserResponse", dt: datetime, _info: Any) -> Any:
         return dt.isoformat() if dt else None
 
+    @classmethod
+    def from_user(cls: type["UserResponse"], user: Any) -> "UserResponse":
+        """
+        Build a response from a stored user without re-running validation.
+
+        Rows are validated when written, so the email, name and URL checks are
+        skipped here. Use model_validate for anything not read from the database.
+        """
+        return cls.model_construct(
+            **{name: getattr(user, name) for name in cls.model_fields}
+        )
+
     model_config = ConfigDict(from_attributes=True)  # Enable ORM mode for Ormar models
 
 
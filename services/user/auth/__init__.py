@@ -9,7 +9,9 @@ from services.user.auth.nextauth import (
     get_current_user,
     get_current_user_flexible,
     get_current_user_from_gateway_headers,
+    get_current_user_full,
     get_current_user_with_claims,
+    require_path_user_ownership,
     require_user_ownership,
     verify_jwt_token,
     verify_user_ownership,
@@ -25,11 +27,13 @@ __all__ = [
     # NextAuth authentication
     "verify_jwt_token",
     "get_current_user",
+    "get_current_user_full",
     "get_current_user_with_claims",
     "get_current_user_flexible",
     "get_current_user_from_gateway_headers",
     "verify_user_ownership",
     "require_user_ownership",
+    "require_path_user_ownership",
     # Service authentication
     "verify_service_authentication",
     "service_permission_required",
@@ -5,16 +5,21 @@ Provides JWT token validation and user extraction.
 Handles token verification, decoding, and user information extraction.
 """
 
+import hashlib
+import hmac
 import logging
 import time
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
 import jwt
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Path, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from services.common.http_errors import AuthError
+from services.common.http_errors import AuthError, ErrorCode
 from services.common.logging_config import get_logger
+from services.user.models.user import User
+from services.user.services.user_service import UserServiceDep
 from services.user.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -22,8 +27,136 @@ logger = logging.getLogger(__name__)
 # HTTP Bearer token security scheme
 security = HTTPBearer(auto_error=False)
 
+# Process-local cache of verified token claims so that repeat requests carrying
+# the same bearer token skip signature verification. Each entry lives until the
+# token's own 'exp' claim, capped at TOKEN_CACHE_MAX_TTL_SECONDS to bound the
+# exposure window for revoked tokens. Only successful verifications are cached.
+TOKEN_CACHE_MAXSIZE = 10000
+TOKEN_CACHE_MAX_TTL_SECONDS = 300
+TOKEN_CACHE_EVICTION_SAMPLE_SIZE = 16
+_token_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
+
+def _token_cache_key(token: str) -> str:
+    """Build the cache key for a raw token without storing the token itself."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def clear_token_cache() -> None:
+    """Clear all cached token verification results."""
+    _token_cache.clear()
+
+
+def _get_cached_token_claims(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return cached claims for a token, lazily evicting the entry if expired."""
+    entry = _token_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    claims, expires_at = entry
+    if time.time() >= expires_at:
+        _token_cache.pop(cache_key, None)
+        return None
+
+    return dict(claims)
+
+
+def _cache_token_claims(cache_key: str, claims: Dict[str, Any]) -> None:
+    """
+    Cache verified claims until min(exp, now + TOKEN_CACHE_MAX_TTL_SECONDS).
+
+    Before inserting, a small sample of the oldest entries is checked and any
+    expired ones are dropped, so memory stays bounded without a full scan.
+    """
+    try:
+        exp = float(claims["exp"])
+    except (KeyError, TypeError, ValueError):
+        return
+
+    now = time.time()
+    expires_at = min(exp, now + TOKEN_CACHE_MAX_TTL_SECONDS)
+    if expires_at <= now:
+        return
+
+    # Dicts preserve insertion order, so the first keys are the oldest entries
+    # and the most likely to have expired.
+    sample = list(islice(_token_cache, TOKEN_CACHE_EVICTION_SAMPLE_SIZE))
+    for key in sample:
+        if _token_cache[key][1] <= now:
+            del _token_cache[key]
+
+    if cache_key not in _token_cache and len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        _token_cache.pop(next(iter(_token_cache)))
+
+    _token_cache[cache_key] = (dict(claims), expires_at)
+
+
+class JWTVerificationConfig(NamedTuple):
+    """Settings-derived inputs to jwt.decode, resolved once per process."""
+
+    verify_signature: bool
+    key: Optional[bytes]
+    issuer: str
+    audience: Optional[str]
+
+
+_jwt_verification_config: Optional[JWTVerificationConfig] = None
+
+
+def get_jwt_verification_config() -> JWTVerificationConfig:
+    """
+    Get the JWT verification config, building it from settings on first use.
+
+    The NextAuth secret is encoded to bytes here so PyJWT does not have to
+    prepare the HMAC key from a string on every request.
+    """
+    global _jwt_verification_config
+    if _jwt_verification_config is None:
+        settings = get_settings()
+        audience = getattr(settings, "nextauth_audience") or None
+        jwt_secret = getattr(settings, "nextauth_jwt_key")
+        _jwt_verification_config = JWTVerificationConfig(
+            verify_signature=getattr(settings, "jwt_verify_signature", True),
+            key=str(jwt_secret).encode() if jwt_secret else None,
+            issuer=getattr(settings, "nextauth_issuer", "nextauth"),
+            audience=audience,
+        )
+    return _jwt_verification_config
+
+
+def reset_jwt_verification_config() -> None:
+    """Reset the JWT verification config (useful for testing)."""
+    global _jwt_verification_config
+    _jwt_verification_config = None
+
 
 async def verify_jwt_token(token: str) -> Dict[str, Any]:
+    """
+    Verify JWT token, reusing cached claims for recently verified tokens.
+
+    Cached claims are served until the token's 'exp' claim (capped at
+    TOKEN_CACHE_MAX_TTL_SECONDS); failed verifications are never cached.
+
+    Args:
+        token: JWT token to verify
+
+    Returns:
+        Decoded token claims (mixed types - timestamps remain numeric)
+
+    Raises:
+        AuthError: If token is invalid
+    """
+    cache_key = _token_cache_key(token)
+    cached_claims = _get_cached_token_claims(cache_key)
+    if cached_claims is not None:
+        return cached_claims
+
+    decoded_token = await _decode_jwt_token(token)
+    _cache_token_claims(cache_key, decoded_token)
+    return decoded_token
+
+
+async def _decode_jwt_token(token: str) -> Dict[str, Any]:
     """
     Verify JWT token using manual verification.
 
@@ -43,30 +176,24 @@ async def verify_jwt_token(token: str) -> Dict[str, Any]:
             "Using manual JWT verification (signature verification potentially disabled based on settings)"
         )
 
-        settings = get_settings()
-        verify_signature = getattr(settings, "jwt_verify_signature", True)
-
-        # Get issuer, audience, and JWT key from settings
-        issuer = getattr(settings, "nextauth_issuer", "nextauth")
-        audience = getattr(settings, "nextauth_audience")
-        jwt_secret = getattr(settings, "nextauth_jwt_key")
+        config = get_jwt_verification_config()
 
-        if verify_signature and jwt_secret:
+        if config.verify_signature and config.key:
             # Verify signature with secret
             decoded_token = jwt.decode(
                 token,
-                key=str(jwt_secret),
+                key=config.key,
                 options={
                     "verify_signature": True,
                     "verify_exp": True,
                     "verify_iat": True,
-                    "verify_aud": bool(audience),
+                    "verify_aud": bool(config.audience),
                 },
                 algorithms=["HS256"],  # NextAuth uses HS256 by default
-                issuer=issuer,
-                audience=audience if audience else None,
+                issuer=config.issuer,
+                audience=config.audience,
             )
-        elif not verify_signature:
+        elif not config.verify_signature:
             # Decode without signature verification but still validate audience if configured
             decoded_token = jwt.decode(
                 token,
@@ -74,10 +201,12 @@ async def verify_jwt_token(token: str) -> Dict[str, Any]:
                     "verify_signature": False,
                     "verify_exp": True,
                     "verify_iat": True,
-                    "verify_aud": bool(audience),  # Validate audience if configured
+                    "verify_aud": bool(
+                        config.audience
+                    ),  # Validate audience if configured
                 },
                 algorithms=["HS256"],
-                audience=audience if audience else None,  # Pass audience if configured
+                audience=config.audience,
             )
         else:
             # Signature verification is required but no secret is configured
@@ -332,6 +461,30 @@ async def get_current_user(
     return await get_current_user_flexible(request, credentials)
 
 
+async def get_current_user_full(
+    user_service: UserServiceDep,
+    current_user_id: str = Depends(get_current_user),
+) -> User:
+    """
+    FastAPI dependency to load the current user's stored record.
+
+    Resolves through UserService's user cache, and FastAPI reuses the result
+    for every consumer within a request, so handlers that need the full user
+    do not look it up again.
+
+    Args:
+        user_service: User service instance
+        current_user_id: Current authenticated user ID
+
+    Returns:
+        User model instance for the authenticated user
+
+    Raises:
+        NotFoundError: If no user exists for the authenticated ID
+    """
+    return await user_service.get_user_by_external_auth_id_auto_detect(current_user_id)
+
+
 async def get_current_user_with_claims(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -390,6 +543,13 @@ async def get_current_user_with_claims(
         raise AuthError(message="Authentication failed")
 
 
+def _user_ids_match(current_user_id: str, resource_user_id: str) -> bool:
+    """Compare user IDs in constant time (encoded, so non-ASCII IDs work too)."""
+    return hmac.compare_digest(
+        current_user_id.encode("utf-8"), resource_user_id.encode("utf-8")
+    )
+
+
 async def verify_user_ownership(current_user_id: str, resource_user_id: str) -> bool:
     """
     Verify that the current user owns the resource being accessed.
@@ -405,7 +565,7 @@ async def verify_user_ownership(current_user_id: str, resource_user_id: str) ->
         HTTPException: If user doesn't own the resource
     """
     logger_instance = get_logger(__name__)
-    if current_user_id != resource_user_id:
+    if not _user_ids_match(current_user_id, resource_user_id):
         logger_instance.warning(
             f"User {current_user_id} attempted to access resource owned by {resource_user_id}"
         )
@@ -440,3 +600,36 @@ async def require_user_ownership(
     except Exception as e:
         logger_instance.error(f"Unexpected ownership verification error: {e}")
         raise HTTPException(status_code=403, detail="Access verification failed")
+
+
+async def require_path_user_ownership(
+    user_id: str = Path(..., description="External auth ID of the resource owner"),
+    current_user_id: str = Depends(get_current_user),
+) -> str:
+    """
+    FastAPI dependency to ensure a ``{user_id}`` path parameter is the caller.
+
+    Runs before the handler body, so requests for another user's resources
+    are rejected without any handler or database work.
+
+    Args:
+        user_id: User ID from the request path
+        current_user_id: Current authenticated user ID from token
+
+    Returns:
+        The path user ID if ownership is verified
+
+    Raises:
+        AuthError: If the path user ID does not match the authenticated user
+    """
+    if not _user_ids_match(current_user_id, user_id):
+        get_logger(__name__).warning(
+            "User attempted to access another user's resource",
+            extra={"user_id": current_user_id, "resource_user_id": user_id},
+        )
+        raise AuthError(
+            "User does not own the resource.",
+            code=ErrorCode.ACCESS_DENIED,
+            status_code=403,
+        )
+    return user_id
@@ -11,7 +11,7 @@ from typing import Any, AsyncGenerator, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy import text
 
 from services.api.v1.user.health import (
@@ -30,6 +30,7 @@ from services.common.logging_config import (
     log_service_startup,
     setup_service_logging,
 )
+from services.user.auth.nextauth import get_jwt_verification_config
 from services.user.database import (
     close_db,
     get_async_session,
@@ -112,6 +113,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         raise RuntimeError("API_MEETINGS_USER_KEY is required but not configured")
 
+    # Resolve JWT verification settings once instead of on the first request
+    get_jwt_verification_config()
+
     # Configure docs URLs
     if settings.debug:
         app.docs_url = "/docs"
@@ -183,6 +187,8 @@ def create_app() -> FastAPI:
             },
         ],
         lifespan=lifespan,
+        # Serialize responses with orjson rather than the stdlib json module
+        default_response_class=ORJSONResponse,
     )
 
     # Configure middleware (must be done before app starts)
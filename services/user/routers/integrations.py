@@ -38,7 +38,7 @@ from services.common.http_errors import (
     ServiceError,
     ValidationError,
 )
-from services.user.auth.nextauth import get_current_user, verify_user_ownership
+from services.user.auth.nextauth import get_current_user, require_path_user_ownership
 from services.user.models.integration import (
     IntegrationProvider,
     IntegrationStatus,
@@ -72,7 +72,6 @@ provider_router = APIRouter(
 
 @router.get("/", response_model=IntegrationListResponse)
 async def list_user_integrations(
-    user_id: str,
     provider: Optional[IntegrationProvider] = Query(
         None, description="Filter by provider"
     ),
@@ -80,7 +79,7 @@ async def list_user_integrations(
         None, description="Filter by status", alias="status"
     ),
     include_token_info: bool = Query(True, description="Include token metadata"),
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> IntegrationListResponse:
     """
     List all integrations for a user.
@@ -100,9 +99,6 @@ async def list_user_integrations(
     - Error information and health status
     - Last sync timestamps and activity
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         return await get_integration_service().get_user_integrations(
             user_id=user_id,
@@ -120,9 +116,8 @@ async def list_user_integrations(
 
 @router.post("/oauth/start", response_model=OAuthStartResponse)
 async def start_oauth_flow(
-    user_id: str,
     request: OAuthStartRequest,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> OAuthStartResponse:
     """
     Start OAuth authorization flow for a provider.
@@ -148,9 +143,6 @@ async def start_oauth_flow(
     - `expires_at`: State expiration time
     - `requested_scopes`: Final scope list that will be requested
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         return await get_integration_service().start_oauth_flow(
             user_id=user_id,
@@ -169,10 +161,9 @@ async def start_oauth_flow(
 
 @router.post("/oauth/callback", response_model=OAuthCallbackResponse)
 async def complete_oauth_flow(
-    user_id: str,
     request: OAuthCallbackRequest,
     provider: IntegrationProvider = Query(..., description="OAuth provider"),
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> OAuthCallbackResponse:
     """
     Complete OAuth authorization flow and create integration.
@@ -200,9 +191,6 @@ async def complete_oauth_flow(
     - `external_user_info`: User information from provider
     - `error`: Error message if flow failed
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         # Handle OAuth errors from provider
         if request.error:
@@ -251,8 +239,7 @@ async def complete_oauth_flow(
 
 @router.get("/stats", response_model=IntegrationStatsResponse)
 async def get_integration_statistics(
-    user_id: str,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> IntegrationStatsResponse:
     """
     Get comprehensive integration statistics for user.
@@ -272,9 +259,6 @@ async def get_integration_statistics(
     - Recent errors with timestamps and details
     - Sync statistics and activity metrics
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         return await get_integration_service().get_integration_statistics(
             user_id=user_id
@@ -287,9 +271,8 @@ async def get_integration_statistics(
 
 @router.get("/{provider}")
 async def get_specific_integration(
-    user_id: str,
     provider: IntegrationProvider,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> IntegrationResponse:
     """
     Get details for a specific integration.
@@ -304,9 +287,6 @@ async def get_specific_integration(
     - Error details and health status
     - Last sync timestamps and activity
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         # Get all integrations and filter for the specific provider
         integrations_response = await get_integration_service().get_user_integrations(
@@ -331,10 +311,9 @@ async def get_specific_integration(
 
 @router.delete("/{provider}", response_model=IntegrationDisconnectResponse)
 async def disconnect_integration(
-    user_id: str,
     provider: IntegrationProvider,
     request: IntegrationDisconnectRequest | None = None,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> IntegrationDisconnectResponse:
     """
     Disconnect an OAuth integration.
@@ -353,9 +332,6 @@ async def disconnect_integration(
     - `disconnected_at`: Timestamp of disconnection
     - `error`: Error message if disconnection failed
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     if request is None:
         request = IntegrationDisconnectRequest()
 
@@ -377,10 +353,9 @@ async def disconnect_integration(
 
 @router.put("/{provider}/refresh", response_model=TokenRefreshResponse)
 async def refresh_integration_tokens(
-    user_id: str,
     provider: IntegrationProvider,
     request: TokenRefreshRequest | None = None,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> TokenRefreshResponse:
     """
     Refresh access tokens for an integration.
@@ -397,9 +372,6 @@ async def refresh_integration_tokens(
     - `refreshed_at`: Timestamp of refresh operation
     - `error`: Error message if refresh failed
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     if request is None:
         request = TokenRefreshRequest()  # type: ignore[assignment]
 
@@ -427,9 +399,8 @@ async def refresh_integration_tokens(
 
 @router.get("/{provider}/health", response_model=IntegrationHealthResponse)
 async def check_integration_health(
-    user_id: str,
     provider: IntegrationProvider,
-    current_user: str = Depends(get_current_user),
+    user_id: str = Depends(require_path_user_ownership),
 ) -> IntegrationHealthResponse:
     """
     Check the health status of an integration.
@@ -449,9 +420,6 @@ async def check_integration_health(
     - `recommendations`: Suggested actions to resolve issues
     - `last_check_at`: Timestamp of health check
     """
-    # Verify user can access this resource
-    await verify_user_ownership(current_user, user_id)
-
     try:
         return await get_integration_service().check_integration_health(
             user_id=user_id,
@@ -37,7 +37,7 @@ from services.common.logging_config import get_logger, request_id_var
 from services.user.auth.service_auth import service_permission_required
 from services.user.services.preferences_service import PreferencesService
 from services.user.services.token_service import get_token_service
-from services.user.services.user_service import get_user_service
+from services.user.services.user_service import UserServiceDep
 
 logger = get_logger(__name__)
 
@@ -211,6 +211,7 @@ async def get_user_status(
 @router.get("/users/by-external-id/{external_auth_id}")
 async def get_user_by_external_auth_id(
     external_auth_id: str,
+    user_service: UserServiceDep,
     service_name: str = Depends(service_permission_required(["read_users"])),
 ) -> Dict[str, Any]:
     """
@@ -223,10 +224,16 @@ async def get_user_by_external_auth_id(
         User data if found, or {"exists": false} if not found
     """
     try:
-        user = await get_user_service().get_user_by_external_auth_id_auto_detect(
+        user = await user_service.find_user_by_external_auth_id_or_none(
             external_auth_id
         )
 
+        if user is None:
+            return {
+                "exists": False,
+                "user_id": external_auth_id,
+            }
+
         return {
             "exists": True,
             "user_id": user.external_auth_id,
@@ -239,11 +246,6 @@ async def get_user_by_external_auth_id(
             "onboarding_completed": user.onboarding_completed,
             "onboarding_step": user.onboarding_step,
         }
-    except NotFoundError:
-        return {
-            "exists": False,
-            "user_id": external_auth_id,
-        }
     except Exception as e:
         logger.error(f"Unexpected error during user lookup by external_auth_id: {e}")
         raise ServiceError(message="Failed to lookup user by external_auth_id")
@@ -251,6 +253,7 @@ async def get_user_by_external_auth_id(
 
 @router.get("/users/exists")
 async def check_user_exists(
+    user_service: UserServiceDep,
     email: str = Query(..., description="Email address to check"),
     provider: Optional[str] = Query(
         None, description="OAuth provider (google, microsoft, etc.)"
@@ -268,9 +271,6 @@ async def check_user_exists(
         {"exists": true/false, "user_id": "id_if_exists", "provider": "provider_if_exists"}
     """
     try:
-        # Get user service instance
-        user_service = get_user_service()
-
         # Use the new provider-aware method that properly considers the provider parameter
         user = await user_service.find_user_by_email_with_provider(email, provider)
 
@@ -301,6 +301,7 @@ async def check_user_exists(
 
 @router.get("/users/id", response_model=UserResponse)
 async def get_user_by_email_internal(
+    user_service: UserServiceDep,
     email: str = Query(..., description="Email address to lookup"),
     provider: Optional[str] = Query(
         None, description="OAuth provider (google, microsoft, etc.)"
@@ -335,16 +336,13 @@ async def get_user_by_email_internal(
         422: If email format is invalid
     """
     try:
-        # Get user service instance
-        user_service = get_user_service()
-
         # Use the new provider-aware method that properly considers the provider parameter
         user = await user_service.find_user_by_email_with_provider(email, provider)
 
         if not user:
             raise NotFoundError(resource="User", identifier=f"email:{email}")
 
-        user_response = UserResponse.from_orm(user)
+        user_response = UserResponse.from_user(user)
 
         logger.debug(
             f"Successfully found user for email {email} with provider {provider}: {user.external_auth_id}"
@@ -365,6 +363,7 @@ async def get_user_by_email_internal(
 @router.post("/users/", response_model=UserCreateResponse)
 async def create_or_upsert_user_internal(
     user_data: UserCreate,
+    user_service: UserServiceDep,
     service_name: str = Depends(service_permission_required(["write_users"])),
 ) -> UserCreateResponse:
     """
@@ -398,15 +397,13 @@ async def create_or_upsert_user_internal(
     try:
         # Try to find existing user first using the new provider-aware method
         # This ensures consistency between GET and POST endpoints and properly considers the provider
-        user_service = get_user_service()
-
         # Use the new provider-aware method that properly considers the provider parameter
         existing_user = await user_service.find_user_by_email_with_provider(
             user_data.email, user_data.auth_provider
         )
 
         if existing_user:
-            user_response = UserResponse.from_orm(existing_user)
+            user_response = UserResponse.from_user(existing_user)
 
             logger.debug(
                 f"Found existing user for email {user_data.email} with provider {user_data.auth_provider}: {existing_user.external_auth_id}"
@@ -420,7 +417,7 @@ async def create_or_upsert_user_internal(
             )
 
             new_user = await user_service.create_user(user_data)
-            user_response = UserResponse.from_orm(new_user)
+            user_response = UserResponse.from_user(new_user)
 
             logger.debug(
                 f"Created new user with {user_data.auth_provider} ID: {user_data.external_auth_id}"
@@ -10,10 +10,13 @@ authorization, and comprehensive error handling.
 # - /users/{user_id} endpoints are deprecated and removed; use /me instead
 """
 
+import hashlib
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Depends, Path, Query
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Header, Path, Query, Response
 
 from services.api.v1.user import ProviderScopesResponse
 from services.api.v1.user.integration import (
@@ -44,16 +47,66 @@ from services.common.http_errors import (
     ValidationError,
 )
 from services.common.logging_config import get_logger
-from services.user.auth import get_current_user
+from services.user.auth import get_current_user, get_current_user_full
 from services.user.auth.service_auth import service_permission_required
 from services.user.models.integration import IntegrationProvider, IntegrationStatus
+from services.user.models.user import User
 from services.user.services.audit_service import audit_logger
-from services.user.services.user_service import get_user_service
+from services.user.services.user_service import UserServiceDep
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Serialized /users/me bodies and their ETags keyed by external_auth_id. Each
+# entry keeps the User instance it was rendered from; UserService drops that
+# instance from its cache on every update or delete, so a changed user never
+# matches a stale body.
+PROFILE_CACHE_MAXSIZE = 5000
+PROFILE_CACHE_TTL_SECONDS = 60
+_profile_cache: TTLCache[str, Tuple[User, bytes, str]] = TTLCache(
+    maxsize=PROFILE_CACHE_MAXSIZE, ttl=PROFILE_CACHE_TTL_SECONDS
+)
+
+# Lets the browser reuse /users/me briefly and revalidate it with If-None-Match
+PROFILE_CACHE_CONTROL = "private, max-age=30"
+# The gateway authenticates by bearer token or session cookie, so a cached
+# profile must not be reused after the browser signs in as someone else
+PROFILE_VARY = "Authorization, Cookie"
+
+
+# OpenAPI response descriptions shared by several endpoints
+_AUTH_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    401: {"description": "Authentication required"},
+}
+_USER_NOT_FOUND_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    **_AUTH_RESPONSES,
+    404: {"description": "User not found"},
+}
+_INTEGRATION_NOT_FOUND_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    **_AUTH_RESPONSES,
+    404: {"description": "Integration not found"},
+}
+_VALIDATION_ERROR_RESPONSES: Dict[int | str, Dict[str, Any]] = {
+    422: {"description": "Validation error"},
+}
+
+
+def clear_profile_cache() -> None:
+    """Drop all cached /users/me bodies (useful for testing)."""
+    _profile_cache.clear()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (a list of possibly weak tags) against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @router.get(
     "/me",
@@ -62,37 +115,48 @@ router = APIRouter(prefix="/users", tags=["users"])
     description="Get the profile of the currently authenticated user.",
     responses={
         200: {"description": "Current user profile retrieved successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "User not found"},
+        304: {"description": "Current user profile not modified"},
+        **_USER_NOT_FOUND_RESPONSES,
     },
 )
 async def get_current_user_profile(
-    current_user_external_auth_id: str = Depends(get_current_user),
-) -> UserResponse:
+    current_user: User = Depends(get_current_user_full),
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
     """
     Get current user's profile.
 
     Convenience endpoint to get the authenticated user's profile
-    without needing to know their database ID.
+    without needing to know their database ID. The serialized body is
+    cached and reused for as long as the underlying user is unchanged.
+    Responses carry an ETag; a matching If-None-Match gets a 304.
     """
+    current_user_external_auth_id = current_user.external_auth_id
     try:
-        current_user = (
-            await get_user_service().get_user_by_external_auth_id_auto_detect(
-                current_user_external_auth_id
-            )
-        )
-        user_response = UserResponse.from_orm(current_user)
+        cached = _profile_cache.get(current_user_external_auth_id)
+        if cached is not None and cached[0] is current_user:
+            _, body, etag = cached
+        else:
+            user_response = UserResponse.from_user(current_user)
+            body = orjson.dumps(user_response.model_dump())
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            _profile_cache[current_user_external_auth_id] = (current_user, body, etag)
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": PROFILE_CACHE_CONTROL,
+            "Vary": PROFILE_VARY,
+        }
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
 
         logger.info(
-            f"Retrieved current user profile for {current_user_external_auth_id}"
+            "Retrieved current user profile for %s", current_user_external_auth_id
         )
-        return user_response
+        return Response(content=body, media_type="application/json", headers=headers)
 
-    except NotFoundError as e:
-        logger.warning(f"Current user not found: {e.message}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error retrieving current user profile: {e}")
+    except Exception:
+        logger.exception("Unexpected error retrieving current user profile")
         raise ServiceError(message="Failed to retrieve current user profile")
 
 
@@ -103,8 +167,7 @@ async def get_current_user_profile(
     description="Get all integrations for the currently authenticated user.",
     responses={
         200: {"description": "Current user integrations retrieved successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "User not found"},
+        **_USER_NOT_FOUND_RESPONSES,
     },
 )
 async def get_current_user_integrations(
@@ -134,15 +197,16 @@ async def get_current_user_integrations(
         )
 
         logger.info(
-            f"Retrieved current user integrations for {current_user_external_auth_id}"
+            "Retrieved current user integrations for %s",
+            current_user_external_auth_id,
         )
         return integrations_response
 
     except NotFoundError as e:
-        logger.warning(f"Current user not found: {e.message}")
+        logger.warning("Current user not found: %s", e.message)
         raise e
-    except Exception as e:
-        logger.error(f"Unexpected error retrieving current user integrations: {e}")
+    except Exception:
+        logger.exception("Unexpected error retrieving current user integrations")
         raise ServiceError(message="Failed to retrieve current user integrations")
 
 
@@ -153,9 +217,8 @@ async def get_current_user_integrations(
     description="Disconnect an OAuth integration for the currently authenticated user.",
     responses={
         200: {"description": "Integration disconnected successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "Integration not found"},
-        422: {"description": "Validation error"},
+        **_INTEGRATION_NOT_FOUND_RESPONSES,
+        **_VALIDATION_ERROR_RESPONSES,
     },
 )
 async def disconnect_current_user_integration(
@@ -183,15 +246,17 @@ async def disconnect_current_user_integration(
         )
 
         logger.info(
-            f"Disconnected {provider.value} integration for user {current_user_external_auth_id}"
+            "Disconnected %s integration for user %s",
+            provider.value,
+            current_user_external_auth_id,
         )
         return IntegrationDisconnectResponse(**result)
 
     except NotFoundError as e:
-        logger.warning(f"Integration not found: {e.message}")
+        logger.warning("Integration not found: %s", e.message)
         raise e
-    except Exception as e:
-        logger.error(f"Unexpected error disconnecting integration: {e}")
+    except Exception:
+        logger.exception("Unexpected error disconnecting integration")
         raise ServiceError(message="Failed to disconnect integration")
 
 
@@ -202,9 +267,8 @@ async def disconnect_current_user_integration(
     description="Refresh access tokens for an integration of the currently authenticated user.",
     responses={
         200: {"description": "Tokens refreshed successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "Integration not found"},
-        422: {"description": "Validation error"},
+        **_INTEGRATION_NOT_FOUND_RESPONSES,
+        **_VALIDATION_ERROR_RESPONSES,
     },
 )
 async def refresh_current_user_integration_tokens(
@@ -231,14 +295,16 @@ async def refresh_current_user_integration_tokens(
         )
 
         logger.info(
-            f"Refreshed tokens for {provider.value} integration for user {current_user_external_auth_id}"
+            "Refreshed tokens for %s integration for user %s",
+            provider.value,
+            current_user_external_auth_id,
         )
         return result
     except NotFoundError as e:
-        logger.warning(f"Integration not found: {e.message}")
+        logger.warning("Integration not found: %s", e.message)
         raise e
     except Exception as e:
-        logger.error(f"Unexpected error refreshing tokens: {e}")
+        logger.exception("Unexpected error refreshing tokens")
         # Return a failed TokenRefreshResponse instead of raising HTTP error
         return TokenRefreshResponse(
             success=False,
@@ -257,8 +323,7 @@ async def refresh_current_user_integration_tokens(
     description="Get details for a specific integration of the currently authenticated user.",
     responses={
         200: {"description": "Integration details retrieved successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "Integration not found"},
+        **_INTEGRATION_NOT_FOUND_RESPONSES,
     },
 )
 async def get_current_user_specific_integration(
@@ -285,16 +350,18 @@ async def get_current_user_specific_integration(
             raise NotFoundError("Integration", identifier=f"provider: {provider.value}")
 
         logger.info(
-            f"Retrieved {provider.value} integration for user {current_user_external_auth_id}"
+            "Retrieved %s integration for user %s",
+            provider.value,
+            current_user_external_auth_id,
         )
         # Return the first (and should be only) integration for this provider
         return integrations_response.integrations[0]
 
     except NotFoundError as e:
-        logger.warning(f"Integration not found: {e.message}")
+        logger.warning("Integration not found: %s", e.message)
         raise e
-    except Exception as e:
-        logger.error(f"Unexpected error retrieving integration: {e}")
+    except Exception:
+        logger.exception("Unexpected error retrieving integration")
         raise ServiceError(message="Failed to retrieve integration")
 
 
@@ -305,8 +372,7 @@ async def get_current_user_specific_integration(
     description="Check the health status of an integration for the currently authenticated user.",
     responses={
         200: {"description": "Health check completed successfully"},
-        401: {"description": "Authentication required"},
-        404: {"description": "Integration not found"},
+        **_INTEGRATION_NOT_FOUND_RESPONSES,
     },
 )
 async def check_current_user_integration_health(
@@ -328,14 +394,16 @@ async def check_current_user_integration_health(
         )
 
         logger.info(
-            f"Checked health for {provider.value} integration for user {current_user_external_auth_id}"
+            "Checked health for %s integration for user %s",
+            provider.value,
+            current_user_external_auth_id,
         )
         return result
     except NotFoundError as e:
-        logger.warning(f"Integration not found: {e.message}")
+        logger.warning("Integration not found: %s", e.message)
         raise e
-    except Exception as e:
-        logger.error(f"Unexpected error checking integration health: {e}")
+    except Exception:
+        logger.exception("Unexpected error checking integration health")
         raise ServiceError(message="Failed to check integration health")
 
 
@@ -346,7 +414,7 @@ async def check_current_user_integration_health(
     response_model=ProviderScopesResponse,
     responses={
         200: {"description": "Scopes retrieved successfully"},
-        401: {"description": "Authentication required"},
+        **_AUTH_RESPONSES,
         404: {"description": "Provider not found"},
     },
 )
@@ -388,10 +456,10 @@ async def get_provider_scopes(
         )
 
     except NotFoundError as e:
-        logger.warning(f"Provider not found: {e.message}")
+        logger.warning("Provider not found: %s", e.message)
         raise e
-    except Exception as e:
-        logger.error(f"Unexpected error retrieving scopes: {e}")
+    except Exception:
+        logger.exception("Unexpected error retrieving scopes")
         raise ServiceError(message="Failed to retrieve scopes")
 
 
@@ -402,12 +470,13 @@ async def get_provider_scopes(
     description="Search users with cursor-based pagination. For admin/service use.",
     responses={
         200: {"description": "User search results retrieved successfully"},
-        401: {"description": "Authentication required"},
+        **_AUTH_RESPONSES,
         422: {"description": "Validation error in search parameters"},
         400: {"description": "Invalid cursor token"},
     },
 )
 async def search_users(
+    user_service: UserServiceDep,
     cursor: Optional[str] = Query(None, description="Cursor token for pagination"),
     limit: Optional[int] = Query(
         None, ge=1, le=100, description="Number of users per page"
@@ -441,15 +510,17 @@ async def search_users(
             onboarding_completed=onboarding_completed,
         )
 
-        search_results = await get_user_service().search_users(search_request)
+        search_results = await user_service.search_users(search_request)
 
         logger.info(
-            f"User search performed by {current_user_id}, found {len(search_results.items)} results"
+            "User search performed by %s, found %d results",
+            current_user_id,
+            len(search_results.items),
         )
         return search_results
 
-    except Exception as e:
-        logger.error(f"Unexpected error in user search: {e}")
+    except Exception:
+        logger.exception("Unexpected error in user search")
         raise ServiceError(message="Failed to search users")
 
 
@@ -469,6 +540,8 @@ async def search_users(
 )
 async def create_or_upsert_user(
     user_data: UserCreate,
+    response: Response,
+    user_service: UserServiceDep,
     service_name: str = Depends(service_permission_required(["write_users"])),
 ) -> UserResponse:
     """
@@ -483,61 +556,54 @@ async def create_or_upsert_user(
     - Only authorized services (frontend, chat, office) can create users
     """
     # Add detailed logging for debugging
-    logger.info(f"User creation request from service: {service_name}")
+    logger.info("User creation request from service: %s", service_name)
     logger.info(
-        f"User data received: external_auth_id={user_data.external_auth_id}, "
-        f"auth_provider={user_data.auth_provider}, email={user_data.email}, "
-        f"first_name={user_data.first_name}, last_name={user_data.last_name}, "
-        f"profile_image_url={user_data.profile_image_url}"
+        "User data received: external_auth_id=%s, auth_provider=%s, email=%s, "
+        "first_name=%s, last_name=%s, profile_image_url=%s",
+        user_data.external_auth_id,
+        user_data.auth_provider,
+        user_data.email,
+        user_data.first_name,
+        user_data.last_name,
+        user_data.profile_image_url,
     )
 
     try:
-        # Try to find existing user first
-        existing_user = (
-            await get_user_service().get_user_by_external_auth_id_auto_detect(
-                user_data.external_auth_id
-            )
-        )
-        user_response = UserResponse.from_orm(existing_user)
+        user, created = await user_service.upsert_user(user_data)
+        user_response = UserResponse.from_user(user)
 
-        logger.info(
-            f"Found existing user for {user_data.auth_provider} ID: {user_data.external_auth_id}"
-        )
+        if created:
+            logger.info(
+                "Created new user with %s ID: %s",
+                user_data.auth_provider,
+                user_data.external_auth_id,
+            )
+        else:
+            response.status_code = 200
+            logger.info(
+                "Found existing user for %s ID: %s",
+                user_data.auth_provider,
+                user_data.external_auth_id,
+            )
         return user_response
 
-    except NotFoundError:
-        # User doesn't exist, create new one
-        logger.info(
-            f"User not found, attempting to create new user with {user_data.auth_provider} ID: {user_data.external_auth_id}"
-        )
-        try:
-            new_user = await get_user_service().create_user(user_data)
-            user_response = UserResponse.from_orm(new_user)
-
-            logger.info(
-                f"Created new user with {user_data.auth_provider} ID: {user_data.external_auth_id}"
+    except ValidationError as e:
+        logger.error("Validation error during user creation: %s", e.message)
+        logger.error("Validation error details: %s", e.details)
+        if "collision" in str(e.message).lower():
+            logger.warning("Email collision during user creation: %s", e.message)
+            raise BrieflyAPIError(
+                status_code=409,
+                error_code=ErrorCode.ALREADY_EXISTS,
+                message="Email collision detected",
+                details=e.details,
             )
-            return user_response
-
-        except ValidationError as e:
-            logger.error(f"Validation error during user creation: {e.message}")
-            logger.error(f"Validation error details: {e.details}")
-            if "collision" in str(e.message).lower():
-                logger.warning(f"Email collision during user creation: {e.message}")
-                raise BrieflyAPIError(
-                    status_code=409,
-                    error_code=ErrorCode.ALREADY_EXISTS,
-                    message="Email collision detected",
-                    details=e.details,
-                )
-            else:
-                logger.warning(f"Validation error during user creation: {e.message}")
-                raise e
+        else:
+            logger.warning("Validation error during user creation: %s", e.message)
+            raise e
 
-    except Exception as e:
-        logger.error(f"Unexpected error in create_or_upsert_user: {e}")
-        logger.error(f"Error type: {type(e)}")
-        logger.error(f"Error details: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error in create_or_upsert_user")
         raise ServiceError(message="Failed to create or retrieve user")
 
 
@@ -548,8 +614,8 @@ async def create_or_upsert_user(
     description="Start OAuth authorization flow for the currently authenticated user.",
     responses={
         200: {"description": "OAuth flow started successfully"},
-        401: {"description": "Authentication required"},
-        422: {"description": "Validation error"},
+        **_AUTH_RESPONSES,
+        **_VALIDATION_ERROR_RESPONSES,
     },
 )
 async def start_current_user_oauth_flow(
@@ -574,12 +640,14 @@ async def start_current_user_oauth_flow(
         )
 
         logger.info(
-            f"Started OAuth flow for {request.provider.value} for user {current_user_external_auth_id}"
+            "Started OAuth flow for %s for user %s",
+            request.provider.value,
+            current_user_external_auth_id,
         )
         return result
 
-    except Exception as e:
-        logger.error(f"Unexpected error starting OAuth flow: {e}")
+    except Exception:
+        logger.exception("Unexpected error starting OAuth flow")
         raise ServiceError(message="Failed to start OAuth flow")
 
 
@@ -590,8 +658,8 @@ async def start_current_user_oauth_flow(
     description="Complete OAuth authorization flow for the currently authenticated user.",
     responses={
         200: {"description": "OAuth flow completed successfully"},
-        401: {"description": "Authentication required"},
-        422: {"description": "Validation error"},
+        **_AUTH_RESPONSES,
+        **_VALIDATION_ERROR_RESPONSES,
     },
 )
 async def complete_current_user_oauth_flow(
@@ -643,10 +711,12 @@ async def complete_current_user_oauth_flow(
         )
 
         logger.info(
-            f"Completed OAuth flow for {provider.value} for user {current_user_external_auth_id}"
+            "Completed OAuth flow for %s for user %s",
+            provider.value,
+            current_user_external_auth_id,
         )
         return result
 
-    except Exception as e:
-        logger.error(f"Unexpected error completing OAuth flow: {e}")
+    except Exception:
+        logger.exception("Unexpected error completing OAuth flow")
         raise ServiceError(message="Failed to complete OAuth flow")
@@ -6,8 +6,12 @@ profile management, and user lifecycle management.
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional, Tuple
 
+from cachetools import TTLCache
+from fastapi import Depends
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from services.api.v1.user.requests import UserFilterRequest
@@ -22,13 +26,23 @@ from services.api.v1.user.user import (
 )
 from services.common.api.v1.schemas import CursorPaginationResponse
 from services.common.http_errors import NotFoundError, ValidationError
-from services.user.database import get_async_session
+from services.user.database import get_async_session, get_engine
 from services.user.models.user import User
 from services.user.services.audit_service import audit_logger
 from services.user.utils.email_collision import EmailCollisionDetector
 
 logger = audit_logger.logger
 
+# Users resolved by external_auth_id are cached briefly so that authenticated
+# requests don't need a database round-trip for every profile lookup.
+USER_CACHE_MAXSIZE = 5000
+USER_CACHE_TTL_SECONDS = 60
+
+# Lookups that found no user are remembered for a few seconds so that retries
+# during sign-in (e.g. NextAuth checking for a brand-new user) skip the database.
+MISSING_USER_CACHE_MAXSIZE = 2000
+MISSING_USER_CACHE_TTL_SECONDS = 3
+
 
 def _parse_iso_datetime(dt_str: str) -> datetime:
     """
@@ -56,6 +70,61 @@ def _parse_iso_datetime(dt_str: str) -> datetime:
 class UserService:
     """Service class for user profile operations."""
 
+    def __init__(self) -> None:
+        self._user_cache: TTLCache[str, User] = TTLCache(
+            maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        self._missing_user_cache: TTLCache[str, bool] = TTLCache(
+            maxsize=MISSING_USER_CACHE_MAXSIZE, ttl=MISSING_USER_CACHE_TTL_SECONDS
+        )
+        # Bumped on every invalidation. Lookups read the generation before
+        # querying and only cache their result if it is unchanged, so a write
+        # that commits while a lookup is awaiting the database is not undone by
+        # the lookup caching the pre-write row (or miss). A single counter keeps
+        # this bounded; an unrelated invalidation only costs a skipped fill.
+        self._cache_generation = 0
+
+    @staticmethod
+    def _missing_external_auth_id_key(external_auth_id: str) -> str:
+        return f"external_auth_id:{external_auth_id}"
+
+    @staticmethod
+    def _missing_email_key(normalized_email: str, provider: Optional[str]) -> str:
+        return f"email:{normalized_email}:{provider or '*'}"
+
+    def invalidate_user_cache(self, external_auth_id: str) -> None:
+        """Drop any cached user or cached miss for the given external auth ID."""
+        self._cache_generation += 1
+        self._user_cache.pop(external_auth_id, None)
+        self._missing_user_cache.pop(
+            self._missing_external_auth_id_key(external_auth_id), None
+        )
+
+    def _invalidate_missing_email(
+        self, normalized_email: Optional[str], auth_provider: str
+    ) -> None:
+        """Drop cached email misses that a user with this email would now match."""
+        if not normalized_email:
+            return
+        self._cache_generation += 1
+        for provider in (None, auth_provider):
+            self._missing_user_cache.pop(
+                self._missing_email_key(normalized_email, provider), None
+            )
+
+    def _cache_user(self, user: User) -> None:
+        """Cache a user found or created, dropping any miss cached for its ID."""
+        self._user_cache[user.external_auth_id] = user
+        self._missing_user_cache.pop(
+            self._missing_external_auth_id_key(user.external_auth_id), None
+        )
+
+    def clear_user_cache(self) -> None:
+        """Drop all cached users and cached misses (useful for testing)."""
+        self._user_cache.clear()
+        self._missing_user_cache.clear()
+        self._cache_generation += 1
+
     async def get_user_by_id(self, user_id: int) -> User:
         """
         Get user by internal database ID.
@@ -211,6 +280,8 @@ class UserService:
                 session.add(user)
                 await session.commit()
                 await session.refresh(user)
+                self.invalidate_user_cache(user.external_auth_id)
+                self._invalidate_missing_email(normalized_email, user.auth_provider)
 
                 logger.debug(
                     f"Created new user with {user_data.auth_provider} ID: {user_data.external_auth_id}"
@@ -227,6 +298,151 @@ class UserService:
                 value=str(user_data),
             )
 
+    async def upsert_user(self, user_data: UserCreate) -> Tuple[User, bool]:
+        """
+        Return the user for an external auth ID, creating it if it doesn't exist.
+
+        The existence check and insert share one session, and the insert uses
+        INSERT ... ON CONFLICT (external_auth_id) DO NOTHING RETURNING so a new
+        user is created and returned in a single statement. A concurrent insert
+        for the same external auth ID is resolved by re-reading the winning row.
+
+        Args:
+            user_data: User creation data
+
+        Returns:
+            Tuple of (user, created) where created is True if a new row was inserted
+
+        Raises:
+            ValidationError: If the email collides with another user or the
+                external auth ID belongs to a deleted user
+        """
+        cached_user = self._user_cache.get(user_data.external_auth_id)
+        if cached_user is not None:
+            return cached_user, False
+
+        generation = self._cache_generation
+        detector = EmailCollisionDetector()
+        try:
+            async_session = get_async_session()
+            async with async_session() as session:
+                by_external_auth_id = select(User).where(
+                    User.external_auth_id == user_data.external_auth_id
+                )
+                result = await session.execute(by_external_auth_id)
+                existing_user = result.scalar_one_or_none()
+
+                if existing_user is None:
+                    collision = await detector.get_collision_details(user_data.email)
+                    if collision["collision"]:
+                        raise ValidationError(
+                            message="Email collision detected",
+                            field="email",
+                            value=user_data.email,
+                            details=collision,
+                        )
+
+                    normalized_email = await detector.normalize_email_async(
+                        user_data.email
+                    )
+                    insert_stmt = self._build_user_insert(
+                        get_engine().dialect.name, user_data, normalized_email
+                    )
+                    result = await session.execute(insert_stmt)
+                    new_user = result.scalar_one_or_none()
+                    await session.commit()
+
+                    if new_user is not None:
+                        self.invalidate_user_cache(new_user.external_auth_id)
+                        self._invalidate_missing_email(
+                            normalized_email, new_user.auth_provider
+                        )
+                        self._cache_user(new_user)
+                        logger.debug(
+                            f"Created new user with {user_data.auth_provider} ID: {user_data.external_auth_id}"
+                        )
+                        return new_user, True
+
+                    # Lost a race with a concurrent insert; read the winning row
+                    result = await session.execute(by_external_auth_id)
+                    existing_user = result.scalar_one()
+
+                if existing_user.deleted_at is not None:
+                    raise ValidationError(
+                        message="User has been deleted",
+                        field="external_auth_id",
+                        value=user_data.external_auth_id,
+                    )
+
+                if self._cache_generation == generation:
+                    self._cache_user(existing_user)
+                return existing_user, False
+
+        except ValidationError:
+            raise
+        except IntegrityError as e:
+            # external_auth_id conflicts are absorbed by ON CONFLICT, so the
+            # remaining unique constraint that can fire is the email column.
+            logger.warning(f"Email collision on insert for {user_data.email}: {e}")
+            raise ValidationError(
+                message="Email collision detected",
+                field="email",
+                value=user_data.email,
+                details={"collision": True},
+            )
+        except Exception as e:
+            logger.error(f"Error upserting user: {e}")
+            raise ValidationError(
+                message=f"Failed to create user: {str(e)}",
+                field="user_data",
+                value=str(user_data),
+            )
+
+    @staticmethod
+    def _build_user_insert(
+        dialect_name: str, user_data: UserCreate, normalized_email: str
+    ) -> Any:
+        """
+        Build an INSERT ... ON CONFLICT DO NOTHING RETURNING statement for a user.
+
+        Args:
+            dialect_name: SQLAlchemy dialect name of the bound engine
+            user_data: User creation data
+            normalized_email: Pre-computed normalized email
+
+        Returns:
+            Executable insert statement returning the inserted User, if any
+        """
+        insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+
+        # Set preferred provider based on auth provider
+        preferred_provider = None
+        if user_data.preferred_provider:
+            preferred_provider = user_data.preferred_provider
+        elif user_data.auth_provider in ["google", "microsoft"]:
+            preferred_provider = user_data.auth_provider
+
+        now = datetime.now(timezone.utc)
+        return (
+            insert(User)
+            .values(
+                external_auth_id=user_data.external_auth_id,
+                auth_provider=user_data.auth_provider,
+                preferred_provider=preferred_provider,
+                email=user_data.email,
+                normalized_email=normalized_email,
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+                profile_image_url=user_data.profile_image_url,
+                onboarding_completed=False,
+                onboarding_step="profile_setup",
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["external_auth_id"])
+            .returning(User)
+        )
+
     async def update_user(self, user_id: int, user_data: UserUpdate) -> User:
         """
         Update an existing user.
@@ -275,6 +491,9 @@ class UserService:
                             user_data.email
                         )
                         update_fields["normalized_email"] = normalized_email
+                        self._invalidate_missing_email(
+                            normalized_email, user.auth_provider
+                        )
                     update_fields["email"] = user_data.email
                 if user_data.first_name is not None:
                     update_fields["first_name"] = user_data.first_name
@@ -288,6 +507,7 @@ class UserService:
                         setattr(user, field, value)
                     await session.commit()
                     await session.refresh(user)
+                    self.invalidate_user_cache(user.external_auth_id)
 
                 logger.info(
                     f"Updated user {user_id} with fields: {list(update_fields.keys())}"
@@ -385,6 +605,7 @@ class UserService:
 
                 await session.commit()
                 await session.refresh(user)
+                self.invalidate_user_cache(user.external_auth_id)
 
                 logger.info(
                     f"Updated onboarding for user {user_id}: completed={onboarding_data.onboarding_completed}"
@@ -478,6 +699,7 @@ class UserService:
                 user.deleted_at = deleted_at
 
                 await session.commit()
+                self.invalidate_user_cache(user.external_auth_id)
 
                 logger.info(f"Soft deleted user {user_id}")
 
@@ -640,7 +862,7 @@ class UserService:
                 validated_filters = pagination.validate_user_filters(filters)
 
                 # Build base query for non-deleted users
-                query = select(User).where(User.deleted_at is None)
+                query = select(User).where(User.deleted_at.is_(None))  # type: ignore[union-attr]
 
                 # Add cursor-based filtering if cursor is provided
                 if cursor_info:
@@ -725,7 +947,7 @@ class UserService:
                 logger.info(f"Found {len(users)} users with cursor pagination")
 
                 # Convert users to UserResponse objects and use response dict directly
-                response["items"] = [UserResponse.from_orm(user) for user in users]
+                response["items"] = [UserResponse.from_user(user) for user in users]
                 return CursorPaginationResponse(**response)
 
         except Exception as e:
@@ -750,7 +972,7 @@ class UserService:
             NotFoundError: If user is not found
         """
         user = await self.get_user_by_id(user_id)
-        return UserResponse.from_orm(user)
+        return UserResponse.from_user(user)
 
     async def get_user_by_external_auth_id_auto_detect(
         self, external_auth_id: str
@@ -759,10 +981,11 @@ class UserService:
         Get user by external auth ID with auto-detection of auth provider.
 
         Uses a smart approach to find users efficiently:
-        1. First searches across all providers to see how many results exist
-        2. If multiple results found, applies provider preference filtering
-        3. If single result found, returns immediately
-        4. If no results found, raises NotFoundError
+        1. Returns a recently resolved user from the in-memory cache if present
+        2. Otherwise searches across all providers to see how many results exist
+        3. If multiple results found, applies provider preference filtering
+        4. If single result found, returns immediately
+        5. If no results found, remembers the miss briefly and raises NotFoundError
 
         Args:
             external_auth_id: External auth provider user ID
@@ -773,6 +996,65 @@ class UserService:
         Raises:
             NotFoundError: If user is not found with any provider
         """
+        user = await self.find_user_by_external_auth_id_or_none(external_auth_id)
+        if user is None:
+            raise NotFoundError(resource="User", identifier=str(external_auth_id or ""))
+        return user
+
+    async def find_user_by_external_auth_id_or_none(
+        self, external_auth_id: str
+    ) -> Optional[User]:
+        """
+        Find a user by external auth ID, returning None if no user exists.
+
+        Same lookup as get_user_by_external_auth_id_auto_detect, for callers
+        where a missing user is an expected outcome rather than an error.
+
+        Args:
+            external_auth_id: External auth provider user ID
+
+        Returns:
+            User model instance, or None if not found
+
+        Raises:
+            NotFoundError: If the lookup itself fails
+        """
+        cached_user = self._user_cache.get(external_auth_id)
+        if cached_user is not None:
+            return cached_user
+
+        missing_key = self._missing_external_auth_id_key(external_auth_id)
+        if missing_key in self._missing_user_cache:
+            return None
+
+        generation = self._cache_generation
+        user = await self._find_user_by_external_auth_id_auto_detect(external_auth_id)
+        if self._cache_generation != generation:
+            # Invalidated while the query was in flight; the result may be stale
+            return user
+
+        if user is None:
+            self._missing_user_cache[missing_key] = True
+            return None
+
+        self._cache_user(user)
+        return user
+
+    async def _find_user_by_external_auth_id_auto_detect(
+        self, external_auth_id: str
+    ) -> Optional[User]:
+        """
+        Look up a user by external auth ID in the database, bypassing the cache.
+
+        Args:
+            external_auth_id: External auth provider user ID
+
+        Returns:
+            User model instance, or None if no active user exists
+
+        Raises:
+            NotFoundError: If the lookup itself fails
+        """
         try:
             async_session = get_async_session()
             async with async_session() as session:
@@ -786,9 +1068,7 @@ class UserService:
                 users = result.scalars().all()
 
                 if not users:
-                    raise NotFoundError(
-                        resource="User", identifier=str(external_auth_id or "")
-                    )
+                    return None
 
                 if len(users) == 1:
                     # Single user found, return immediately
@@ -860,7 +1140,7 @@ class UserService:
             )
         else:
             user = await self.get_user_by_external_auth_id_auto_detect(external_auth_id)
-        return UserResponse.from_orm(user)
+        return UserResponse.from_user(user)
 
     async def verify_user_exists(self, user_id: int) -> bool:
         """
@@ -882,23 +1162,33 @@ class UserService:
         """
         Get multiple users by their internal database IDs.
 
+        Users are loaded with a single IN query and returned in the order of
+        the requested IDs; missing or deleted users are skipped.
+
         Args:
             user_ids: List of internal database IDs
 
         Returns:
             List of user model instances
         """
+        if not user_ids:
+            return []
+
         try:
             async_session = get_async_session()
             async with async_session() as session:
-                all_users = []
-                for user_id in user_ids:
-                    result = await session.execute(
-                        select(User).where(User.id == user_id, User.deleted_at is None)
+                result = await session.execute(
+                    select(User).where(
+                        User.id.in_(set(user_ids)),  # type: ignore[union-attr]
+                        User.deleted_at.is_(None),  # type: ignore[union-attr]
                     )
-                    user = result.scalar_one_or_none()
-                    if user:
-                        all_users.append(user)
+                )
+                users_by_id = {user.id: user for user in result.scalars().all()}
+                all_users = [
+                    users_by_id[user_id]
+                    for user_id in user_ids
+                    if user_id in users_by_id
+                ]
 
                 logger.debug(
                     f"Retrieved {len(all_users)} users from {len(user_ids)} requested IDs"
@@ -932,6 +1222,7 @@ class UserService:
                 # Update last login timestamp
                 user.updated_at = datetime.now(timezone.utc)
                 await session.commit()
+                self.invalidate_user_cache(user.external_auth_id)
 
                 logger.info(f"Updated last login for user {user_id}")
 
@@ -977,6 +1268,11 @@ class UserService:
                 f"Using consistent normalization for {email}: {normalized_email}"
             )
 
+            missing_key = self._missing_email_key(normalized_email, provider)
+            if missing_key in self._missing_user_cache:
+                return None
+            generation = self._cache_generation
+
             # Query database by normalized email
             async_session = get_async_session()
             async with async_session() as session:
@@ -998,6 +1294,8 @@ class UserService:
                         f"No user found for email {email} (normalized: {normalized_email}) "
                         f"with provider {provider or 'any'}"
                     )
+                    if self._cache_generation == generation:
+                        self._missing_user_cache[missing_key] = True
                     return None
 
                 if len(users) == 1:
@@ -1064,3 +1362,7 @@ def get_user_service() -> UserService:
     if _user_service is None:
         _user_service = UserService()
     return _user_service
+
+
+# FastAPI dependency resolving to the process-wide UserService instance
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
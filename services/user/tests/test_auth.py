@@ -5,6 +5,7 @@ Tests Clerk JWT validation, service authentication, user extraction,
 and authorization checks.
 """
 
+import time
 from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
@@ -15,9 +16,12 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from services.common.http_errors import AuthError
 from services.user.auth.nextauth import (
+    clear_token_cache,
     extract_user_id_from_token,
     get_current_user_flexible,
+    require_path_user_ownership,
     require_user_ownership,
+    reset_jwt_verification_config,
     verify_jwt_token,
     verify_user_ownership,
 )
@@ -54,6 +58,16 @@ def patch_settings(monkeypatch):
     monkeypatch.setattr("services.user.settings._settings", test_settings)
 
 
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Ensure cached token verifications do not leak between tests."""
+    clear_token_cache()
+    reset_jwt_verification_config()
+    yield
+    clear_token_cache()
+    reset_jwt_verification_config()
+
+
 class TestNextAuthAuthentication(BaseUserManagementTest):
     """Test cases for NextAuth JWT authentication."""
 
@@ -253,6 +267,49 @@ class TestNextAuthAuthentication(BaseUserManagementTest):
 
             assert exc_info.value.status_code == 403
 
+    @pytest.mark.asyncio
+    async def test_require_path_user_ownership_success(self):
+        """Test that the path dependency passes through the caller's own ID."""
+        result = await require_path_user_ownership(
+            user_id="user_123", current_user_id="user_123"
+        )
+        assert result == "user_123"
+
+    @pytest.mark.asyncio
+    async def test_require_path_user_ownership_failure(self):
+        """Test that the path dependency rejects another user's ID with 403."""
+        with pytest.raises(AuthError) as exc_info:
+            await require_path_user_ownership(
+                user_id="user_456", current_user_id="user_123"
+            )
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_require_path_user_ownership_compares_in_constant_time(self):
+        """Test that IDs are compared with hmac.compare_digest."""
+        with patch(
+            "services.user.auth.nextauth.hmac.compare_digest", return_value=True
+        ) as mock_compare:
+            await require_path_user_ownership(
+                user_id="user_123", current_user_id="user_123"
+            )
+
+        mock_compare.assert_called_once_with(b"user_123", b"user_123")
+
+    @pytest.mark.asyncio
+    async def test_require_path_user_ownership_non_ascii_ids(self):
+        """Test that non-ASCII IDs are compared rather than raising TypeError."""
+        result = await require_path_user_ownership(
+            user_id="usér_123", current_user_id="usér_123"
+        )
+        assert result == "usér_123"
+
+        with pytest.raises(AuthError):
+            await require_path_user_ownership(
+                user_id="usér_456", current_user_id="usér_123"
+            )
+
 
 class TestServiceAuthentication(BaseUserManagementTest):
     """Test cases for service-to-service authentication."""
@@ -574,3 +631,167 @@ class TestNextAuthSecurity(BaseUserManagementTest):
                 result = await verify_jwt_token("test-token")
                 assert result["sub"] == "user_123"
                 assert result["aud"] == "briefly-backend"
+
+
+class TestJWTTokenCache(BaseUserManagementTest):
+    """Test caching of verified JWT token claims."""
+
+    def _valid_claims(self) -> dict:
+        now = int(time.time())
+        return {
+            "sub": "user_123",
+            "iss": "nextauth",
+            "exp": now + 3600,
+            "iat": now,
+        }
+
+    @pytest.mark.asyncio
+    async def test_verified_token_is_cached(self):
+        """Test that a second verification of the same token skips decoding."""
+        with (
+            patch("services.user.auth.nextauth.jwt.decode") as mock_decode,
+            patch("services.user.auth.nextauth.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.jwt_verify_signature = False
+            mock_decode.return_value = self._valid_claims()
+
+            first = await verify_jwt_token("cached-token")
+            second = await verify_jwt_token("cached-token")
+
+            assert first == second
+            assert mock_decode.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self):
+        """Test that verification failures are retried rather than cached."""
+        with (
+            patch("services.user.auth.nextauth.jwt.decode") as mock_decode,
+            patch("services.user.auth.nextauth.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.jwt_verify_signature = False
+            mock_decode.side_effect = jwt.InvalidTokenError("Invalid token")
+
+            with pytest.raises(AuthError):
+                await verify_jwt_token("bad-token")
+
+            mock_decode.side_effect = None
+            mock_decode.return_value = self._valid_claims()
+
+            result = await verify_jwt_token("bad-token")
+            assert result["sub"] == "user_123"
+            assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_cached_claims_are_reverified(self):
+        """Test that cached claims past their exp claim are not served."""
+        with (
+            patch("services.user.auth.nextauth.jwt.decode") as mock_decode,
+            patch("services.user.auth.nextauth.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.jwt_verify_signature = False
+            mock_decode.return_value = self._valid_claims()
+
+            await verify_jwt_token("expiring-token")
+
+            with patch(
+                "services.user.auth.nextauth.time.time",
+                return_value=time.time() + 7200,
+            ):
+                mock_decode.side_effect = jwt.ExpiredSignatureError("Token expired")
+                with pytest.raises(AuthError, match="Token has expired"):
+                    await verify_jwt_token("expiring-token")
+
+            assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_lifetime_is_capped_by_max_ttl(self):
+        """Test that long-lived tokens are re-verified after the max cache TTL."""
+        from services.user.auth.nextauth import TOKEN_CACHE_MAX_TTL_SECONDS
+
+        with (
+            patch("services.user.auth.nextauth.jwt.decode") as mock_decode,
+            patch("services.user.auth.nextauth.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.jwt_verify_signature = False
+            mock_decode.return_value = self._valid_claims()
+
+            await verify_jwt_token("long-lived-token")
+
+            with patch(
+                "services.user.auth.nextauth.time.time",
+                return_value=time.time() + TOKEN_CACHE_MAX_TTL_SECONDS + 1,
+            ):
+                await verify_jwt_token("long-lived-token")
+
+            assert mock_decode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_evicted_on_insert(self):
+        """Test that inserting a new token drops expired entries from the cache."""
+        from services.user.auth import nextauth
+
+        with (
+            patch("services.user.auth.nextauth.jwt.decode") as mock_decode,
+            patch("services.user.auth.nextauth.get_settings") as mock_get_settings,
+        ):
+            mock_get_settings.return_value.jwt_verify_signature = False
+            mock_decode.return_value = self._valid_claims()
+
+            await verify_jwt_token("first-token")
+            assert len(nextauth._token_cache) == 1
+
+            later = time.time() + nextauth.TOKEN_CACHE_MAX_TTL_SECONDS + 1
+            claims = self._valid_claims()
+            claims["exp"] = int(later) + 3600
+            mock_decode.return_value = claims
+
+            with patch("services.user.auth.nextauth.time.time", return_value=later):
+                await verify_jwt_token("second-token")
+
+            assert len(nextauth._token_cache) == 1
+
+
+class TestJWTVerificationConfig(BaseUserManagementTest):
+    """Test the process-wide JWT verification config."""
+
+    def _make_token(self, secret: str) -> str:
+        now = int(time.time())
+        return jwt.encode(
+            {"sub": "user_123", "iss": "nextauth", "exp": now + 3600, "iat": now},
+            secret,
+            algorithm="HS256",
+        )
+
+    @pytest.mark.asyncio
+    async def test_settings_are_read_once(self):
+        """Test that repeated verifications resolve settings only once."""
+        with patch("services.user.auth.nextauth.get_settings") as mock_get_settings:
+            mock_settings = mock_get_settings.return_value
+            mock_settings.jwt_verify_signature = True
+            mock_settings.nextauth_jwt_key = "config-secret"
+            mock_settings.nextauth_issuer = "nextauth"
+            mock_settings.nextauth_audience = None
+
+            for _ in range(2):
+                # Drop cached claims so the token is decoded again
+                clear_token_cache()
+                result = await verify_jwt_token(self._make_token("config-secret"))
+                assert result["sub"] == "user_123"
+
+            assert mock_get_settings.call_count == 1
+
+    def test_reset_rebuilds_from_settings(self):
+        """Test that resetting the config picks up changed settings."""
+        from services.user.auth.nextauth import get_jwt_verification_config
+
+        with patch("services.user.auth.nextauth.get_settings") as mock_get_settings:
+            mock_settings = mock_get_settings.return_value
+            mock_settings.nextauth_jwt_key = "first-secret"
+            mock_settings.nextauth_audience = None
+            assert get_jwt_verification_config().key == b"first-secret"
+
+            mock_settings.nextauth_jwt_key = "second-secret"
+            assert get_jwt_verification_config().key == b"first-secret"
+
+            reset_jwt_verification_config()
+            assert get_jwt_verification_config().key == b"second-secret"
@@ -22,6 +22,18 @@ class BaseUserManagementTest:
 
         reset_settings()
 
+        # Cached users from a previous test's database must not leak through
+        from services.user.routers.users import clear_profile_cache
+        from services.user.services.user_service import get_user_service
+
+        get_user_service().clear_user_cache()
+        clear_profile_cache()
+
+        # JWT verification settings are resolved once per process
+        from services.user.auth.nextauth import reset_jwt_verification_config
+
+        reset_jwt_verification_config()
+
         # Create temporary database file for tests that need file-based SQLite
         # Use tempfile.NamedTemporaryFile with delete=False and close immediately
         # so SQLite can open the file
@@ -66,6 +78,12 @@ class BaseUserManagementTest:
                 future = executor.submit(asyncio.run, reset_db())
                 future.result()
 
+        # The service settings singleton holds this test's DB_URL_USER; drop it
+        # so the next test doesn't reuse this test's database
+        import services.user.settings as user_settings
+
+        user_settings._settings = None
+
         # Remove temporary database file
         if hasattr(self, "db_path") and os.path.exists(self.db_path):
             os.unlink(self.db_path)
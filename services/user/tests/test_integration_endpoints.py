@@ -378,3 +378,60 @@ class TestMeIntegrationEndpointSecurity(BaseUserManagementIntegrationTest):
                 status.HTTP_401_UNAUTHORIZED,
                 status.HTTP_403_FORBIDDEN,
             ], f"Endpoint {endpoint} should require authentication"
+
+
+class TestUserIntegrationOwnership(BaseUserManagementIntegrationTest):
+    """Test that /users/{user_id}/integrations is limited to the caller's own ID."""
+
+    def test_other_users_integrations_are_forbidden(self):
+        """Test that every user-scoped route rejects another user's ID with 403."""
+        base = "/v1/users/other_user/integrations"
+        requests = [
+            ("get", f"{base}/"),
+            ("post", f"{base}/oauth/start"),
+            ("post", f"{base}/oauth/callback?provider=google"),
+            ("get", f"{base}/stats"),
+            ("get", f"{base}/google"),
+            ("delete", f"{base}/google"),
+            ("put", f"{base}/google/refresh"),
+            ("get", f"{base}/google/health"),
+        ]
+
+        with patch(
+            "services.user.routers.integrations.get_integration_service"
+        ) as mock_service:
+            for method, url in requests:
+                if method in ("post", "put"):
+                    response = getattr(self.client, method)(url, json={})
+                else:
+                    response = getattr(self.client, method)(url)
+
+                assert (
+                    response.status_code == status.HTTP_403_FORBIDDEN
+                ), f"{method.upper()} {url} should be forbidden"
+
+            mock_service.assert_not_called()
+
+    def test_own_integrations_are_served(self):
+        """Test that the caller's own user ID reaches the handler."""
+        mock_response = IntegrationListResponse(
+            integrations=[],
+            total=0,
+            active_count=0,
+            error_count=0,
+        )
+
+        with patch(
+            "services.user.routers.integrations.get_integration_service"
+        ) as mock_service:
+            mock_service.return_value.get_user_integrations = AsyncMock(
+                return_value=mock_response
+            )
+            response = self.client.get("/v1/users/user_123/integrations/")
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_service.return_value.get_user_integrations.assert_awaited_once()
+        assert (
+            mock_service.return_value.get_user_integrations.await_args.kwargs["user_id"]
+            == "user_123"
+        )
@@ -29,6 +29,12 @@ class TestApplicationStartup(BaseUserManagementIntegrationTest):
             in self.app.description
         )
 
+    def test_default_response_class_is_orjson(self):
+        """Test that responses are serialized with orjson by default."""
+        from fastapi.responses import ORJSONResponse
+
+        assert self.app.router.default_response_class is ORJSONResponse
+
     def test_cors_middleware_configured(self):
         """Test that CORS middleware is configured (simplified test)."""
         # Test that the app has middleware configured
@@ -6,8 +6,10 @@ error handling, authentication, and authorization.
 """
 
 from datetime import datetime, timezone
+from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 from fastapi import HTTPException, status
 
@@ -19,6 +21,7 @@ from services.common.api.v1.schemas import CursorPaginationResponse
 from services.common.http_errors import NotFoundError
 from services.user.models.user import User
 from services.user.services.user_service import get_user_service
+from services.user.tests.test_base import BaseUserManagementIntegrationTest
 
 
 class TestUserProfileEndpoints:
@@ -83,6 +86,7 @@ class TestUserProfileEndpoints:
             from services.user.routers.users import search_users
 
             result = await search_users(
+                user_service=get_user_service(),
                 query="test",
                 email=None,
                 onboarding_completed=None,
@@ -103,6 +107,7 @@ class TestUserProfileEndpoints:
             from services.user.routers.users import search_users
 
             await search_users(
+                user_service=get_user_service(),
                 query="john",
                 email="john@example.com",
                 onboarding_completed=True,
@@ -125,14 +130,9 @@ class TestUserProfileEndpoints:
         """Test successful current user profile retrieval."""
         mock_user = self.create_mock_user()
 
-        with (
-            patch.object(
-                get_user_service(),
-                "get_user_by_external_auth_id_auto_detect",
-                return_value=mock_user,
-            ),
-            patch("services.api.v1.user.user.UserResponse.from_orm") as mock_from_orm,
-        ):
+        with patch(
+            "services.api.v1.user.user.UserResponse.from_user"
+        ) as mock_from_user:
             mock_response = UserResponse(
                 id=1,
                 external_auth_id="user_123",
@@ -146,20 +146,67 @@ class TestUserProfileEndpoints:
                 created_at=datetime.now(timezone.utc),
                 updated_at=datetime.now(timezone.utc),
             )
-            mock_from_orm.return_value = mock_response
+            mock_from_user.return_value = mock_response
 
             from services.user.routers.users import get_current_user_profile
 
-            result = await get_current_user_profile(
-                current_user_external_auth_id="user_123"
-            )
+            result = await get_current_user_profile(current_user=mock_user)
+
+            assert orjson.loads(result.body)["external_auth_id"] == "user_123"
+            mock_from_user.assert_called_once_with(mock_user)
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_profile_reuses_serialized_body(self):
+        """Test that the body is rebuilt only when a new user instance is passed."""
+        from services.user.routers.users import (
+            clear_profile_cache,
+            get_current_user_profile,
+        )
+
+        clear_profile_cache()
+        first_user = User(
+            id=1,
+            external_auth_id="user_123",
+            auth_provider="google",
+            email="first@example.com",
+            onboarding_completed=False,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        updated_user = first_user.model_copy(update={"email": "second@example.com"})
+
+        with patch.object(
+            UserResponse, "from_user", wraps=UserResponse.from_user
+        ) as mock_from_user:
+            bodies = [
+                (await get_current_user_profile(current_user=user)).body
+                for user in (first_user, first_user, updated_user)
+            ]
+
+        assert bodies[0] == bodies[1]
+        assert orjson.loads(bodies[2])["email"] == "second@example.com"
+        assert mock_from_user.call_count == 2
+        clear_profile_cache()
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_full_loads_user(self):
+        """Test that the full-user dependency resolves the caller's record."""
+        mock_user = self.create_mock_user()
+
+        with patch.object(
+            get_user_service(),
+            "get_user_by_external_auth_id_auto_detect",
+            return_value=mock_user,
+        ) as mock_get:
+            from services.user.auth import get_current_user_full
 
-            assert result.external_auth_id == "user_123"
-            # Verify the service method was called
-            get_user_service().get_user_by_external_auth_id_auto_detect.assert_called_once_with(
-                "user_123"
+            result = await get_current_user_full(
+                user_service=get_user_service(), current_user_id="user_123"
             )
 
+            assert result is mock_user
+            mock_get.assert_called_once_with("user_123")
+
     @pytest.mark.asyncio
     async def test_get_current_user_profile_not_found(self):
         """Test current user profile retrieval when user not found."""
@@ -168,10 +215,12 @@ class TestUserProfileEndpoints:
         ) as mock_get:
             mock_get.side_effect = NotFoundError(resource="User", identifier="user_123")
 
-            from services.user.routers.users import get_current_user_profile
+            from services.user.auth import get_current_user_full
 
             with pytest.raises(NotFoundError) as exc_info:
-                await get_current_user_profile(current_user_external_auth_id="user_123")
+                await get_current_user_full(
+                    user_service=get_user_service(), current_user_id="user_123"
+                )
             assert "User user_123 not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
@@ -280,6 +329,452 @@ class TestUserServiceIntegration:
         return user
 
 
+class TestUserResponseFromUser:
+    """Tests for building UserResponse from stored users."""
+
+    def _stored_user(self) -> User:
+        now = datetime.now(timezone.utc)
+        return User(
+            id=7,
+            external_auth_id="stored_user",
+            auth_provider="google",
+            email="stored@example.com",
+            first_name="Stored",
+            last_name="User",
+            preferred_provider="google",
+            onboarding_completed=True,
+            onboarding_step=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def test_matches_validated_response(self):
+        """Test that the unvalidated response serializes like model_validate."""
+        user = self._stored_user()
+
+        assert (
+            UserResponse.from_user(user).model_dump()
+            == UserResponse.model_validate(user).model_dump()
+        )
+
+    def test_skips_field_validators(self):
+        """Test that stored values are not re-validated."""
+        with patch(
+            "services.api.v1.user.user.validate_email_address"
+        ) as mock_validate_email:
+            response = UserResponse.from_user(self._stored_user())
+
+        assert response.email == "stored@example.com"
+        mock_validate_email.assert_not_called()
+
+
+class TestUserServiceCache:
+    """Tests for the in-memory user cache keyed by external_auth_id."""
+
+    def create_mock_user(self, external_auth_id: str = "user_123") -> User:
+        """Create a mock user for testing."""
+        user = MagicMock(spec=User)
+        user.id = 1
+        user.external_auth_id = external_auth_id
+        user.auth_provider = "nextauth"
+        user.deleted_at = None
+        return user
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_served_from_cache(self):
+        """Test that a second lookup does not hit the database."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+        mock_user = self.create_mock_user()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(return_value=mock_user),
+        ) as mock_find:
+            first = await service.get_user_by_external_auth_id_auto_detect("user_123")
+            second = await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            assert first is mock_user
+            assert second is mock_user
+            mock_find.assert_awaited_once_with("user_123")
+
+    @pytest.mark.asyncio
+    async def test_invalidation_forces_fresh_lookup(self):
+        """Test that invalidating a user reloads it on the next lookup."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(return_value=self.create_mock_user()),
+        ) as mock_find:
+            await service.get_user_by_external_auth_id_auto_detect("user_123")
+            service.invalidate_user_cache("user_123")
+            await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            assert mock_find.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lookup_errors_are_not_cached(self):
+        """Test that failed lookups are retried on the next request."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(
+                side_effect=NotFoundError(resource="User", identifier="user_123")
+            ),
+        ) as mock_find:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            assert mock_find.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_briefly_cached(self):
+        """Test that a lookup that found no user is not repeated right away."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(return_value=None),
+        ) as mock_find:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            mock_find.assert_awaited_once_with("user_123")
+
+    @pytest.mark.asyncio
+    async def test_or_none_lookup_returns_none_for_missing_user(self):
+        """Test that the Optional lookup reports a missing user without raising."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(return_value=None),
+        ) as mock_find:
+            assert (
+                await service.find_user_by_external_auth_id_or_none("user_123") is None
+            )
+            with pytest.raises(NotFoundError):
+                await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            mock_find.assert_awaited_once_with("user_123")
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_lookup_is_not_undone(self):
+        """Test that a row read before a concurrent write is not cached."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+        stale_user = self.create_mock_user()
+        fresh_user = self.create_mock_user()
+        rows = [stale_user, fresh_user]
+
+        async def find(external_auth_id: str) -> User:
+            row = rows.pop(0)
+            if row is stale_user:
+                # An update commits and invalidates while this query is in flight
+                service.invalidate_user_cache(external_auth_id)
+            return row
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(side_effect=find),
+        ) as mock_find:
+            first = await service.get_user_by_external_auth_id_auto_detect("user_123")
+            second = await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            assert first is stale_user
+            assert second is fresh_user
+            assert mock_find.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_creation_during_lookup_does_not_cache_miss(self):
+        """Test that a miss read before a concurrent create is not cached."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+        created_user = self.create_mock_user()
+        rows = [None, created_user]
+
+        async def find(external_auth_id: str) -> Optional[User]:
+            row = rows.pop(0)
+            if row is None:
+                # The user is created while this query is in flight
+                service.invalidate_user_cache(external_auth_id)
+            return row
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(side_effect=find),
+        ):
+            with pytest.raises(NotFoundError):
+                await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            user = await service.get_user_by_external_auth_id_auto_detect("user_123")
+            assert user is created_user
+
+    @pytest.mark.asyncio
+    async def test_invalidation_clears_missing_user(self):
+        """Test that invalidating (e.g. after creation) drops a cached miss."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+        mock_user = self.create_mock_user()
+
+        with patch.object(
+            service,
+            "_find_user_by_external_auth_id_auto_detect",
+            new=AsyncMock(side_effect=[None, mock_user]),
+        ) as mock_find:
+            with pytest.raises(NotFoundError):
+                await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            service.invalidate_user_cache("user_123")
+            user = await service.get_user_by_external_auth_id_auto_detect("user_123")
+
+            assert user is mock_user
+            assert mock_find.await_count == 2
+
+
+class TestGetUsersByIds:
+    """Tests for batch loading users by internal ID."""
+
+    @pytest.mark.asyncio
+    async def test_loads_users_with_single_query_in_request_order(self):
+        """Test that all IDs are fetched at once and returned in request order."""
+        from services.user.services.user_service import UserService
+
+        service = UserService()
+        users = []
+        for user_id in (1, 2):
+            user = MagicMock(spec=User)
+            user.id = user_id
+            users.append(user)
+
+        with patch(
+            "services.user.services.user_service.get_async_session"
+        ) as mock_get_session:
+            mock_session = AsyncMock()
+            mock_async_context = AsyncMock()
+            mock_async_context.__aenter__.return_value = mock_session
+            mock_async_context.__aexit__.return_value = None
+            mock_get_session.return_value = MagicMock(return_value=mock_async_context)
+
+            mock_result = MagicMock()
+            mock_result.scalars.return_value.all.return_value = users
+            mock_session.execute.return_value = mock_result
+
+            result = await service.get_users_by_ids([2, 3, 1])
+
+            assert result == [users[1], users[0]]
+            mock_session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_skip_database(self):
+        """Test that an empty ID list does not open a session."""
+        from services.user.services.user_service import UserService
+
+        with patch(
+            "services.user.services.user_service.get_async_session"
+        ) as mock_get_session:
+            assert await UserService().get_users_by_ids([]) == []
+            mock_get_session.assert_not_called()
+
+
+class TestCreateOrUpsertUserEndpoint(BaseUserManagementIntegrationTest):
+    """Integration tests for POST /v1/users/ backed by a real database."""
+
+    def _user_payload(self, **overrides) -> dict:
+        payload = {
+            "external_auth_id": "upsert_user_1",
+            "auth_provider": "google",
+            "email": "upsert@example.com",
+            "first_name": "Up",
+            "last_name": "Sert",
+        }
+        payload.update(overrides)
+        return payload
+
+    def test_creates_then_returns_existing_user(self):
+        """Test that the first call creates (201) and the second returns (200)."""
+        headers = {"X-API-Key": "test-frontend-key"}
+
+        created = self.client.post(
+            "/v1/users/", json=self._user_payload(), headers=headers
+        )
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.json()["preferred_provider"] == "google"
+
+        get_user_service().clear_user_cache()
+        existing = self.client.post(
+            "/v1/users/", json=self._user_payload(), headers=headers
+        )
+        assert existing.status_code == status.HTTP_200_OK
+        assert existing.json()["id"] == created.json()["id"]
+
+    def test_stale_cached_miss_returns_existing_user(self):
+        """Test that a miss cached before another worker created the user is dropped."""
+        headers = {"X-API-Key": "test-frontend-key"}
+
+        created = self.client.post(
+            "/v1/users/", json=self._user_payload(), headers=headers
+        )
+        assert created.status_code == status.HTTP_201_CREATED
+
+        service = get_user_service()
+        service.clear_user_cache()
+        service._missing_user_cache[
+            service._missing_external_auth_id_key("upsert_user_1")
+        ] = True
+
+        existing = self.client.post(
+            "/v1/users/", json=self._user_payload(), headers=headers
+        )
+        assert existing.status_code == status.HTTP_200_OK
+        assert existing.json()["id"] == created.json()["id"]
+
+        by_id = self.client.get(
+            "/v1/internal/users/by-external-id/upsert_user_1", headers=headers
+        )
+        assert by_id.json()["exists"] is True
+
+    def test_email_collision_returns_conflict(self):
+        """Test that a different user with a colliding email gets a 409."""
+        headers = {"X-API-Key": "test-frontend-key"}
+
+        first = self.client.post(
+            "/v1/users/", json=self._user_payload(), headers=headers
+        )
+        assert first.status_code == status.HTTP_201_CREATED
+
+        second = self.client.post(
+            "/v1/users/",
+            json=self._user_payload(external_auth_id="upsert_user_2"),
+            headers=headers,
+        )
+        assert second.status_code == status.HTTP_409_CONFLICT
+
+    def test_creation_clears_cached_misses(self):
+        """Test that lookups made before sign-up see the user once created."""
+        headers = {"X-API-Key": "test-frontend-key"}
+        payload = self._user_payload(
+            external_auth_id="upsert_user_3", email="newcomer@example.com"
+        )
+        by_id_url = "/v1/internal/users/by-external-id/upsert_user_3"
+        exists_url = "/v1/internal/users/exists?email=newcomer@example.com"
+
+        assert self.client.get(by_id_url, headers=headers).json()["exists"] is False
+        assert self.client.get(exists_url, headers=headers).json()["exists"] is False
+
+        created = self.client.post("/v1/users/", json=payload, headers=headers)
+        assert created.status_code == status.HTTP_201_CREATED
+
+        assert self.client.get(by_id_url, headers=headers).json()["exists"] is True
+        assert self.client.get(exists_url, headers=headers).json()["exists"] is True
+
+
+class TestCurrentUserProfileEndpoint(BaseUserManagementIntegrationTest):
+    """Integration tests for GET /v1/users/me conditional requests."""
+
+    def _create_current_user(self) -> None:
+        created = self.client.post(
+            "/v1/users/",
+            json={
+                "external_auth_id": "user_123",
+                "auth_provider": "google",
+                "email": "me@example.com",
+            },
+            headers={"X-API-Key": "test-frontend-key"},
+        )
+        assert created.status_code == status.HTTP_201_CREATED
+
+    @staticmethod
+    def _vary(response) -> set:
+        return {value.strip() for value in response.headers["Vary"].split(",")}
+
+    def test_profile_has_etag_and_cache_control(self):
+        """Test that the profile response is cacheable and validated by ETag."""
+        self._create_current_user()
+
+        response = self.client.get("/v1/users/me")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["external_auth_id"] == "user_123"
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"] == "private, max-age=30"
+        assert {"Authorization", "Cookie"} <= self._vary(response)
+
+    def test_matching_if_none_match_returns_not_modified(self):
+        """Test that a matching (or weak) ETag gets an empty 304."""
+        self._create_current_user()
+        etag = self.client.get("/v1/users/me").headers["ETag"]
+
+        for if_none_match in (etag, f'"stale", W/{etag}'):
+            response = self.client.get(
+                "/v1/users/me", headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response.headers["ETag"] == etag
+            assert {"Authorization", "Cookie"} <= self._vary(response)
+
+    def test_stale_if_none_match_returns_profile(self):
+        """Test that a non-matching ETag gets the full profile."""
+        self._create_current_user()
+
+        response = self.client.get("/v1/users/me", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == "me@example.com"
+
+
+class TestSearchUsersEndpoint(BaseUserManagementIntegrationTest):
+    """Integration tests for GET /v1/users/search backed by a real database."""
+
+    def test_search_returns_active_users(self):
+        """Test that the search query matches non-deleted users."""
+        headers = {"X-API-Key": "test-frontend-key"}
+        for index in range(2):
+            created = self.client.post(
+                "/v1/users/",
+                json={
+                    "external_auth_id": f"search_user_{index}",
+                    "auth_provider": "google",
+                    "email": f"search{index}@example.com",
+                    "first_name": "Searchable",
+                },
+                headers=headers,
+            )
+            assert created.status_code == status.HTTP_201_CREATED
+
+        response = self.client.get(
+            "/v1/users/search", params={"query": "Searchable", "limit": 1}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [item["external_auth_id"] for item in body["items"]] == ["search_user_0"]
+        assert body["has_next"] is True
+
+
 class TestEmailResolutionEndpoint:
     """Integration tests for email resolution endpoint."""
 